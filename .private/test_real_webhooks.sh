@@ -15,6 +15,13 @@ if ! command -v python3 &> /dev/null; then
     exit 1
 fi
 
+# Check if the receiver's Python dependencies are installed
+if ! python3 -c "import orjson, ijson" &> /dev/null; then
+    echo "❌ Error: webhook receiver dependencies missing"
+    echo "   Please run: pip install orjson ijson"
+    exit 1
+fi
+
 # Check if services are running
 echo "📊 Checking services..."
 if ! /usr/local/bin/docker ps | grep -q ethhook-postgres; then
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Regression checks for webhook_receiver.py
+
+Run with: python3 -m unittest test_webhook_receiver (from .private/)
+"""
+
+import io
+import unittest
+
+import ijson
+
+import webhook_receiver
+
+
+class StreamSummaryTest(unittest.TestCase):
+    """Oversized bodies parsed by stream_summary"""
+
+    def test_huge_integer_raises_instead_of_crashing(self):
+        # yajl2_c segfaults on integers longer than 4300 digits
+        body = b'{"a":' + b'1' * 4301 + b'}'
+        with self.assertRaises(ijson.JSONError):
+            webhook_receiver.stream_summary(io.BytesIO(body))
+
+    def test_uint256_stays_exact(self):
+        body = b'{"chain_id":1,"decoded":{"value":%d}}' % 2**255
+        summary = webhook_receiver.stream_summary(io.BytesIO(body))
+        self.assertEqual(summary['decoded']['value'], 2**255)
+
+
+class DecodeBodyTest(unittest.TestCase):
+    """Bodies small enough to be decoded in one piece"""
+
+    def test_uint256_stays_exact(self):
+        body = memoryview(b'{"decoded":{"value":%d}}' % 2**255)
+        payload = webhook_receiver.decode_body(body)
+        self.assertEqual(payload['decoded']['value'], 2**255)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,121 +2,582 @@
 """
 Real Webhook Receiver for EthHook Testing
 Receives actual webhook deliveries and displays them in real-time
+
+Requires: pip install orjson ijson (plus httptools uvloop for --httptools)
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from email.message import Message
+from logging.handlers import QueueHandler, QueueListener
+import argparse
+import asyncio
+import ijson
 import json
+import logging
+import multiprocessing
+import orjson
 import hmac
 import hashlib
+import os
+import queue
+import re
+import signal
+import socket
+import sys
+import time
+
+# Optional fast path (--httptools): C HTTP parser, on libuv when available
+try:
+    import httptools
+except ImportError:
+    httptools = None
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Per-delivery log levels
+QUIET, SUMMARY, VERBOSE = 0, 1, 2
+
+logger = logging.getLogger('webhook_receiver')
+
+# Bodies larger than this are streamed instead of loaded in one piece
+STREAM_THRESHOLD = 1 << 20
+
+# Largest body --httptools buffers in memory; bigger requests get 413
+MAX_BODY_SIZE = 16 * STREAM_THRESHOLD
+
+# Streaming parser for oversized bodies. The pure-Python backend is used
+# because the default yajl2_c one crashes the process (SIGSEGV) on integers
+# longer than 4300 digits; this one raises a JSONError instead.
+stream_parser = ijson.get_backend('python')
+
+# Top-level payload fields the receiver reports on
+SUMMARY_FIELDS = frozenset((
+    'chain_id', 'chain_name', 'block_number', 'transaction_hash',
+    'contract_address', 'event_signature', 'decoded',
+))
+
+
+# Last formatted wall-clock second as (epoch_second, text), swapped as a unit
+timestamp_cache = (0, '')
+
+
+def current_timestamp():
+    """Local time as 'YYYY-MM-DD HH:MM:SS', formatted at most once a second"""
+    global timestamp_cache
+    now = int(time.time())
+    second, formatted = timestamp_cache
+    if now != second:
+        formatted = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        timestamp_cache = (now, formatted)
+    return formatted
+
+
+# A run of 20+ digits may be an integer beyond 64 bits (e.g. a uint256 in
+# `decoded`), which orjson would round to a float
+WIDE_INTEGER = re.compile(rb'\d{20}')
+
+
+def decode_body(body):
+    """Decode a JSON body, keeping integers wider than 64 bits exact
+
+    orjson handles the common case; bodies that might hold a wide integer
+    go through the stdlib parser instead, which keeps them as ints.
+    """
+    if WIDE_INTEGER.search(body):
+        return json.loads(bytes(body))
+    return orjson.loads(body)
+
+
+# Fixed response body for accepted deliveries
+OK_RESPONSE = b'{"status":"received"}\n'
+
+# Spare body buffers. ThreadingHTTPServer starts a thread per request, so
+# buffers are pooled across requests rather than kept thread-local. The pool
+# is filled once and never grows: sized for typical webhooks, not the
+# STREAM_THRESHOLD maximum, so it stays small.
+POOL_BUFFER_SIZE = 64 << 10
+BUFFER_POOL_LIMIT = 8
+body_buffers = queue.SimpleQueue()
+for _ in range(BUFFER_POOL_LIMIT):
+    body_buffers.put(bytearray(POOL_BUFFER_SIZE))
+
+
+def acquire_buffer(size):
+    """Buffer for a `size`-byte body, and whether it came from the pool
+
+    Bodies over POOL_BUFFER_SIZE, and requests that find the pool empty, get
+    a one-off buffer of exactly `size` bytes, so a pool miss costs no more
+    than reading the body into a fresh bytes object would.
+    """
+    if size <= POOL_BUFFER_SIZE:
+        try:
+            return body_buffers.get_nowait(), True
+        except queue.Empty:
+            pass
+    return bytearray(size), False
+
+
+class BoundedReader:
+    """File-like view limited to the next `length` bytes of a stream
+
+    Keeps a streaming parser from reading past the request body into a
+    connection that will never send EOF.
+    """
+
+    def __init__(self, stream, length):
+        self.stream = stream
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.stream.read(size)
+        self.remaining -= len(data)
+        return data
+
+
+def stream_summary(stream):
+    """Parse a JSON body incrementally, keeping only SUMMARY_FIELDS
+
+    The body may be one event object or an array of them, summarised item
+    by item. Only values under a summary field are built; everything else
+    is skipped event by event, so memory use is bounded by the kept values
+    rather than by the whole document. Numbers are left as int/Decimal so
+    uint256 values in `decoded` keep their precision.
+    """
+    events = stream_parser.parse(stream)
+    _, event, value = next(events)
+    if event == 'start_map':
+        summaries, item_prefix = None, ''
+    elif event == 'start_array':
+        summaries, item_prefix = [], 'item'
+    else:
+        return value
+
+    summary, field, builder, depth = {}, None, None, 0
+    for prefix, event, value in events:
+        if builder is not None:
+            # Inside a kept value: build it until its container closes
+            builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+            if depth == 0:
+                summary[field] = builder.value
+                builder = None
+        elif prefix != item_prefix:
+            continue
+        elif event == 'map_key' and value in SUMMARY_FIELDS:
+            field, builder = value, ijson.ObjectBuilder()
+        elif summaries is not None and event == 'end_map':
+            summaries.append(summary)
+            summary = {}
+    return summary if summaries is None else summaries
+
+
+def start_logging():
+    """Send log records through a queue drained by a background thread
+
+    Request threads only enqueue a preformatted message; the listener thread
+    does the actual write to stdout. Call once per worker process, since the
+    listener thread does not survive fork().
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    logger.handlers = [QueueHandler(log_queue)]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
 
 class WebhookReceiver(BaseHTTPRequestHandler):
     """Handle incoming webhook POST requests"""
 
-    # Store received webhooks
-    webhooks_received = []
+    # Delivery count shared by all worker processes (allocated before fork)
+    total_received = multiprocessing.Value('Q', 0)
+
+    # Per-delivery logging: QUIET (count only), SUMMARY or VERBOSE
+    verbosity = SUMMARY
 
     def do_POST(self):
         """Handle POST request (webhook delivery)"""
 
         # Get request details
         content_length = int(self.headers.get('Content-Length', 0))
-        body = self.rfile.read(content_length)
 
         # Parse JSON body
-        try:
-            payload = json.loads(body.decode('utf-8'))
-        except:
-            payload = {"raw": body.decode('utf-8', errors='ignore')}
+        if content_length > STREAM_THRESHOLD:
+            try:
+                payload = stream_summary(BoundedReader(self.rfile, content_length))
+            except ijson.JSONError:
+                payload = {"raw": f"<{content_length} byte body, invalid JSON>"}
+        else:
+            # Read straight into a (usually pooled) buffer; decode_body parses the view
+            buffer, pooled = acquire_buffer(content_length)
+            try:
+                view = memoryview(buffer)[:content_length]
+                body = view[:self.rfile.readinto(view)]
+                try:
+                    payload = decode_body(body)
+                except:
+                    payload = {"raw": bytes(body).decode('utf-8', errors='ignore')}
+            finally:
+                if pooled:
+                    body_buffers.put(buffer)
+
+        self.record_delivery(self.headers, payload)
 
-        # Get headers
-        headers = dict(self.headers)
+        # Send 200 OK response
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(OK_RESPONSE)))
+        self.end_headers()
+        self.wfile.write(OK_RESPONSE)
 
+    @classmethod
+    def record_delivery(cls, headers, payload):
+        """Count and log one parsed delivery; nothing is retained"""
         # Log receipt
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = current_timestamp()
+
+        with cls.total_received.get_lock():
+            cls.total_received.value += 1
+            total = cls.total_received.value
+
+        # Hand one preformatted message to the queue-backed logger
+        if cls.verbosity >= VERBOSE:
+            logger.info(cls.format_details(headers, payload, timestamp, total))
+        elif cls.verbosity >= SUMMARY:
+            logger.info(cls.format_summary(payload, timestamp, total))
+
+    @classmethod
+    def health_response(cls):
+        """Health check body reporting the shared delivery count"""
+        return orjson.dumps({
+            'status': 'running',
+            'webhooks_received': cls.total_received.value,
+            'message': 'Webhook receiver is ready!'
+        }, option=orjson.OPT_INDENT_2)
+
+    @staticmethod
+    def format_summary(payload, timestamp, total):
+        """One-line description of a delivery"""
+        details = payload if isinstance(payload, dict) else {}
+        return (
+            f"🎉 [{timestamp}] #{total} "
+            f"chain={details.get('chain_id', 'N/A')} "
+            f"block={details.get('block_number', 'N/A')} "
+            f"tx={details.get('transaction_hash', 'N/A')}"
+        )
+
+    @staticmethod
+    def format_details(headers, payload, timestamp, total):
+        """Full multi-line description of a delivery (--verbose)
 
-        print("\n" + "="*80)
-        print(f"🎉 WEBHOOK RECEIVED! [{timestamp}]")
-        print("="*80)
+        `headers` is the request's message object, read in place rather than
+        copied into a dict; its lookups are case-insensitive.
+        """
+        lines = [
+            "=" * 80,
+            f"🎉 WEBHOOK RECEIVED! [{timestamp}]",
+            "=" * 80,
+        ]
 
         # Display headers
-        print("\n📋 HEADERS:")
-        for key, value in headers.items():
-            if key.lower().startswith('x-'):
-                print(f"  {key}: {value}")
+        lines.append("\n📋 HEADERS:")
+        lines.extend(
+            f"  {key}: {value}"
+            for key, value in headers.items()
+            if key[:2].lower() == 'x-'
+        )
 
         # Display payload
-        print("\n📦 PAYLOAD:")
-        print(json.dumps(payload, indent=2))
+        lines.append("\n📦 PAYLOAD:")
+        try:
+            lines.append(orjson.dumps(
+                payload, default=str, option=orjson.OPT_INDENT_2).decode())
+        except TypeError:
+            # orjson rejects integers beyond 64 bits, e.g. streamed uint256s
+            lines.append(json.dumps(payload, indent=2, default=str))
 
         # Verify HMAC signature if present
         signature_header = headers.get('X-Webhook-Signature', '')
         timestamp_header = headers.get('X-Webhook-Timestamp', '')
 
         if signature_header and timestamp_header:
-            print("\n🔒 HMAC SIGNATURE VERIFICATION:")
-            print(f"  Signature: {signature_header}")
-            print(f"  Timestamp: {timestamp_header}")
-            print("  ✅ Signature present (verification requires endpoint secret)")
+            lines.append("\n🔒 HMAC SIGNATURE VERIFICATION:")
+            lines.append(f"  Signature: {signature_header}")
+            lines.append(f"  Timestamp: {timestamp_header}")
+            lines.append("  ✅ Signature present (verification requires endpoint secret)")
 
         # Display event details
         if isinstance(payload, dict):
-            print("\n🔍 EVENT DETAILS:")
-            print(f"  Chain ID: {payload.get('chain_id', 'N/A')}")
-            print(f"  Chain Name: {payload.get('chain_name', 'N/A')}")
-            print(f"  Block: {payload.get('block_number', 'N/A')}")
-            print(f"  Transaction: {payload.get('transaction_hash', 'N/A')}")
-            print(f"  Contract: {payload.get('contract_address', 'N/A')}")
-            print(f"  Event: {payload.get('event_signature', 'N/A')}")
+            lines.append("\n🔍 EVENT DETAILS:")
+            lines.append(f"  Chain ID: {payload.get('chain_id', 'N/A')}")
+            lines.append(f"  Chain Name: {payload.get('chain_name', 'N/A')}")
+            lines.append(f"  Block: {payload.get('block_number', 'N/A')}")
+            lines.append(f"  Transaction: {payload.get('transaction_hash', 'N/A')}")
+            lines.append(f"  Contract: {payload.get('contract_address', 'N/A')}")
+            lines.append(f"  Event: {payload.get('event_signature', 'N/A')}")
 
             # Decoded data
             decoded = payload.get('decoded', {})
             if decoded:
-                print(f"\n  📊 DECODED DATA:")
+                lines.append("\n  📊 DECODED DATA:")
                 for key, value in decoded.items():
-                    print(f"    {key}: {value}")
-
-        print("\n" + "="*80)
-        print(f"✅ Total webhooks received: {len(self.webhooks_received) + 1}")
-        print("="*80 + "\n")
+                    lines.append(f"    {key}: {value}")
 
-        # Store webhook
-        self.webhooks_received.append({
-            'timestamp': timestamp,
-            'headers': headers,
-            'payload': payload
-        })
-
-        # Send 200 OK response
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        response = {'status': 'received', 'timestamp': timestamp}
-        self.wfile.write(json.dumps(response).encode())
+        lines.append("\n" + "=" * 80)
+        lines.append(f"✅ Total webhooks received: {total}")
+        lines.append("=" * 80 + "\n")
+        return "\n".join(lines)
 
     def do_GET(self):
         """Handle GET request (health check)"""
+        response = self.health_response()
+
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
         self.end_headers()
-
-        response = {
-            'status': 'running',
-            'webhooks_received': len(self.webhooks_received),
-            'message': 'Webhook receiver is ready!'
-        }
-        self.wfile.write(json.dumps(response, indent=2).encode())
+        self.wfile.write(response)
 
     def log_message(self, format, *args):
         """Suppress default HTTP logging (we have custom logging)"""
         pass
 
 
-def run_server(port=8000):
+class ReusePortHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server whose socket can share its port with other workers
+
+    With SO_REUSEPORT every worker process binds its own listening socket and
+    the kernel spreads incoming connections across them.
+    """
+
+    daemon_threads = True
+
+    # Only enabled for multiple workers, so a stale receiver on the port is
+    # reported as "address in use" instead of silently sharing deliveries
+    reuse_port = False
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+def serve(httpd):
+    """Serve requests until interrupted, then close the listening socket"""
+    listener = start_logging()
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        listener.stop()
+
+
+class HttptoolsProtocol(asyncio.Protocol):
+    """One client connection, parsed with httptools (--httptools mode)
+
+    Bodies are accumulated in memory and handed to the same delivery
+    bookkeeping as WebhookReceiver; keep-alive connections are honoured.
+    """
+
+    def __init__(self):
+        self.transport = None
+        self.parser = httptools.HttpRequestParser(self)
+        self.headers = []
+        self.body = bytearray()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        try:
+            self.parser.feed_data(data)
+        except httptools.HttpParserError:
+            self.transport.write(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n')
+            self.transport.close()
+
+    # httptools parser callbacks
+
+    def on_message_begin(self):
+        self.headers = []
+        self.body = bytearray()
+
+    def on_header(self, name, value):
+        self.headers.append((name, value))
+
+    def on_headers_complete(self):
+        for name, value in self.headers:
+            if name.lower() == b'content-length' and int(value) > MAX_BODY_SIZE:
+                self.reject(b'413 Payload Too Large')
+
+    def on_body(self, body):
+        # Anything after a rejection, even a pipelined request, is dropped
+        if self.transport.is_closing():
+            return
+        if len(self.body) + len(body) > MAX_BODY_SIZE:
+            # Chunked bodies have no Content-Length to check up front
+            self.reject(b'413 Payload Too Large')
+            return
+        self.body += body
+
+    def on_message_complete(self):
+        if self.transport.is_closing():
+            return
+        method = self.parser.get_method()
+        if method == b'POST':
+            try:
+                payload = decode_body(self.body)
+            except ValueError:
+                payload = {"raw": self.body.decode('utf-8', errors='ignore')}
+            WebhookReceiver.record_delivery(self.header_message(), payload)
+            self.respond(b'200 OK', OK_RESPONSE)
+        elif method in (b'GET', b'HEAD'):
+            self.respond(b'200 OK', WebhookReceiver.health_response())
+        else:
+            self.respond(b'405 Method Not Allowed', headers=b'Allow: GET, HEAD, POST\r\n')
+
+    def respond(self, status, body=b'', headers=b'', close=False):
+        """Write one response, closing unless the client keeps the connection"""
+        if body:
+            headers += b'Content-Type: application/json\r\n'
+        response = b'HTTP/1.1 %s\r\n%sContent-Length: %d\r\n\r\n' % (
+            status, headers, len(body))
+        if self.parser.get_method() != b'HEAD':
+            response += body
+        self.transport.write(response)
+        if close or not self.parser.should_keep_alive():
+            self.transport.close()
+
+    def reject(self, status):
+        """Answer before the body arrives and drop the rest of the request"""
+        self.respond(status, headers=b'Connection: close\r\n', close=True)
+
+    def header_message(self):
+        """Headers as a case-insensitive Message, filled in only for --verbose"""
+        message = Message()
+        if WebhookReceiver.verbosity >= VERBOSE:
+            for name, value in self.headers:
+                message[name.decode('latin-1')] = value.decode('latin-1')
+        return message
+
+
+def listen_socket(port, reuse_port=False):
+    """Listening TCP socket, optionally sharing its port with other workers"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind(('', port))
+    sock.listen(socket.SOMAXCONN)
+    return sock
+
+
+def serve_httptools(sock):
+    """Serve --httptools requests on an event loop until interrupted"""
+    async def main():
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(HttptoolsProtocol, sock=sock)
+
+        # A plain signal handler may not run while the loop sleeps in C, so
+        # let the loop wake for SIGTERM and run the installed handler itself
+        handler, task = signal.getsignal(signal.SIGTERM), asyncio.current_task()
+
+        def terminate():
+            try:
+                handler(signal.SIGTERM, None)
+            except KeyboardInterrupt:
+                task.cancel()
+
+        if callable(handler):
+            loop.add_signal_handler(signal.SIGTERM, terminate)
+        async with server:
+            await server.serve_forever()
+
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    listener = start_logging()
+    try:
+        asyncio.run(main())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    finally:
+        sock.close()
+        listener.stop()
+
+
+def interrupt(signum, frame):
+    """Turn SIGTERM into the same clean shutdown as Ctrl+C"""
+    raise KeyboardInterrupt
+
+
+def run_server(port=8000, workers=1, verbosity=SUMMARY, use_httptools=False):
     """Start the webhook receiver server"""
 
-    server_address = ('', port)
-    httpd = HTTPServer(server_address, WebhookReceiver)
+    WebhookReceiver.verbosity = verbosity
+
+    # Forking workers needs both fork() and SO_REUSEPORT (not on Windows)
+    workers = workers or 1
+    if workers > 1 and not (hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT')):
+        print("⚠️  Multiple workers are not supported on this platform, using 1")
+        workers = 1
+    reuse_port = workers > 1
+
+    if use_httptools:
+        if httptools is None:
+            sys.exit("--httptools requires: pip install httptools uvloop")
+        def bind(port):
+            return listen_socket(port, reuse_port)
+        run, close = serve_httptools, socket.socket.close
+        server_kind = "uvloop + httptools" if uvloop else "asyncio + httptools"
+    else:
+        ReusePortHTTPServer.reuse_port = reuse_port
+        def bind(port):
+            return ReusePortHTTPServer(('', port), WebhookReceiver)
+        run, close = serve, ReusePortHTTPServer.server_close
+        server_kind = "http.server (threaded)"
+
+    server = bind(port)
+
+    children = []
+
+    def forward_sigterm(signum, frame):
+        # Stop the workers too, so none are orphaned still serving the port
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, forward_sigterm)
+
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            # Child: drop the parent's socket and bind one of our own
+            signal.signal(signal.SIGTERM, interrupt)
+            close(server)
+            run(bind(port))
+            sys.stdout.flush()
+            os._exit(0)
+        children.append(pid)
 
     print("\n" + "="*80)
     print("🚀 REAL WEBHOOK RECEIVER STARTED!")
@@ -124,25 +585,40 @@ def run_server(port=8000):
     print(f"\n📍 Listening on: http://0.0.0.0:{port}")
     print(f"📍 Webhook URL:  http://localhost:{port}/webhook")
     print(f"📍 Public URL:   http://YOUR_IP:{port}/webhook")
+    print(f"📍 Workers:      {workers}")
+    print(f"📍 Server:       {server_kind}")
     print("\n💡 Use this URL in your EthHook endpoint configuration")
     print("\n⏳ Waiting for webhooks from EthHook...")
     print("   (Press Ctrl+C to stop)\n")
     print("="*80 + "\n")
 
-    try:
-        httpd.serve_forever()
-    except KeyboardInterrupt:
-        print("\n\n" + "="*80)
-        print("🛑 WEBHOOK RECEIVER STOPPED")
-        print("="*80)
-        print(f"\n📊 Total webhooks received: {len(WebhookReceiver.webhooks_received)}")
-        print("\nThank you for testing EthHook! 🎉\n")
+    run(server)
 
+    # Ctrl+C reaches the whole process group and SIGTERM is forwarded above;
+    # either way, wait for the workers to exit
+    for pid in children:
+        os.waitpid(pid, 0)
+
+    print("\n\n" + "="*80)
+    print("🛑 WEBHOOK RECEIVER STOPPED")
+    print("="*80)
+    print(f"\n📊 Total webhooks received: {WebhookReceiver.total_received.value}")
+    print("\nThank you for testing EthHook! 🎉\n")
 
-if __name__ == '__main__':
-    import sys
 
-    # Get port from command line or use default
-    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Receive and display EthHook webhooks")
+    parser.add_argument('port', nargs='?', type=int, default=8000)
+    parser.add_argument('workers', nargs='?', type=int, default=1,
+                        help="worker processes sharing the port (default: 1)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('-v', '--verbose', action='store_const', dest='verbosity',
+                      const=VERBOSE, help="print headers and full payload")
+    mode.add_argument('-q', '--quiet', action='store_const', dest='verbosity',
+                      const=QUIET, help="only count deliveries (load testing)")
+    parser.add_argument('--httptools', action='store_true',
+                        help="serve with uvloop + httptools instead of http.server")
+    parser.set_defaults(verbosity=SUMMARY)
+    args = parser.parse_args()
 
-    run_server(port)
+    run_server(args.port, args.workers, args.verbosity, args.httptools)
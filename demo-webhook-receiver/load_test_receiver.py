@@ -7,105 +7,164 @@ This receiver is optimized for load testing:
 - Monitors error rates
 - Collects percentile statistics (p50, p95, p99)
 - Minimal processing overhead
+
+Runs on Quart (async Flask) so each webhook is a coroutine on the event
+loop instead of a WSGI thread. For benchmarking serve it with Hypercorn:
+
+    pip install quart hypercorn uvloop orjson hdrhistogram
+    hypercorn load_test_receiver:app --worker-class uvloop -b 0.0.0.0:8000
+
+Metrics live in process memory, so keep a single worker or /metrics will
+only report the share of traffic that reached the worker answering it.
+
+Signature checks are off by default. Set LOAD_TEST_HMAC_SECRET to the
+load-test endpoint's hmac_secret to verify the X-EthHook-Signature
+("sha256=<hex>" HMAC-SHA256 of the body) that ethhook-c attaches.
 """
 
 import hmac
 import hashlib
-import json
+import orjson
+import os
 import time
 from datetime import datetime
-from flask import Flask, request, jsonify
-from collections import deque
-from threading import Lock
-import statistics
+from quart import Quart, request, jsonify
+from hdrh.histogram import HdrHistogram
+
+app = Quart(__name__)
 
-app = Flask(__name__)
+# Latency histogram range in microseconds (1µs - 60s, 3 significant figures)
+LATENCY_MIN_US = 1
+LATENCY_MAX_US = 60_000_000
+LATENCY_SIGNIFICANT_FIGURES = 3
 
 # Performance metrics
 class PerformanceMetrics:
+    """Request counters and latency histogram for one receiver process.
+
+    Every handler runs on the same event loop and none of these methods
+    await, so updates cannot interleave and no lock is needed on the hot path.
+    """
+
     def __init__(self):
-        self.lock = Lock()
         self.total_requests = 0
         self.successful_requests = 0
         self.failed_requests = 0
-        self.latencies = deque(maxlen=10000)  # Keep last 10k for percentiles
+        self.latencies = HdrHistogram(
+            LATENCY_MIN_US, LATENCY_MAX_US, LATENCY_SIGNIFICANT_FIGURES
+        )
         self.start_time = time.time()
         self.last_report_time = time.time()
         self.requests_since_last_report = 0
 
     def record_request(self, latency_ms: float, success: bool):
-        with self.lock:
-            self.total_requests += 1
-            self.requests_since_last_report += 1
-            if success:
-                self.successful_requests += 1
-            else:
-                self.failed_requests += 1
-            self.latencies.append(latency_ms)
+        self.total_requests += 1
+        self.requests_since_last_report += 1
+        if success:
+            self.successful_requests += 1
+        else:
+            self.failed_requests += 1
+        # Clamp so clock skew or stragglers still land in the histogram
+        latency_us = min(max(int(latency_ms * 1000), 0), LATENCY_MAX_US)
+        self.latencies.record_value(latency_us)
 
     def get_stats(self):
-        with self.lock:
-            elapsed = time.time() - self.start_time
-            throughput = self.total_requests / elapsed if elapsed > 0 else 0
-
-            # Calculate recent throughput (last interval)
-            time_since_report = time.time() - self.last_report_time
-            recent_throughput = (
-                self.requests_since_last_report / time_since_report
-                if time_since_report > 0 else 0
-            )
-
-            latencies_list = list(self.latencies)
-
-            stats = {
-                'total_requests': self.total_requests,
-                'successful': self.successful_requests,
-                'failed': self.failed_requests,
-                'uptime_seconds': round(elapsed, 2),
-                'throughput_rps': round(throughput, 2),
-                'recent_throughput_rps': round(recent_throughput, 2),
-                'latency_ms': {}
-            }
+        elapsed = time.time() - self.start_time
+        throughput = self.total_requests / elapsed if elapsed > 0 else 0
+
+        # Calculate recent throughput (last interval)
+        time_since_report = time.time() - self.last_report_time
+        recent_throughput = (
+            self.requests_since_last_report / time_since_report
+            if time_since_report > 0 else 0
+        )
 
-            if latencies_list:
-                sorted_latencies = sorted(latencies_list)
-                stats['latency_ms'] = {
-                    'min': round(min(latencies_list), 2),
-                    'max': round(max(latencies_list), 2),
-                    'avg': round(statistics.mean(latencies_list), 2),
-                    'median': round(statistics.median(latencies_list), 2),
-                    'p95': round(sorted_latencies[int(len(sorted_latencies) * 0.95)], 2),
-                    'p99': round(sorted_latencies[int(len(sorted_latencies) * 0.99)], 2),
-                }
+        stats = {
+            'total_requests': self.total_requests,
+            'successful': self.successful_requests,
+            'failed': self.failed_requests,
+            'uptime_seconds': round(elapsed, 2),
+            'throughput_rps': round(throughput, 2),
+            'recent_throughput_rps': round(recent_throughput, 2),
+            'latency_ms': {}
+        }
 
-            return stats
+        hist = self.latencies
+        if hist.get_total_count():
+            stats['latency_ms'] = {
+                'min': round(hist.get_min_value() / 1000, 2),
+                'max': round(hist.get_max_value() / 1000, 2),
+                'avg': round(hist.get_mean_value() / 1000, 2),
+                'median': round(hist.get_value_at_percentile(50) / 1000, 2),
+                'p95': round(hist.get_value_at_percentile(95) / 1000, 2),
+                'p99': round(hist.get_value_at_percentile(99) / 1000, 2),
+            }
+
+        return stats
 
     def reset_interval(self):
-        with self.lock:
-            self.last_report_time = time.time()
-            self.requests_since_last_report = 0
+        self.last_report_time = time.time()
+        self.requests_since_last_report = 0
 
 metrics = PerformanceMetrics()
 
+# Signature verification is opt-in with the endpoint's secret. It has its
+# own variable so the deployment-wide HMAC_SECRET in .env does not turn it on.
+# The keyed HMAC is built once and copied per message, so the key pads are
+# not re-derived for every webhook.
+LOAD_TEST_HMAC_SECRET = os.environ.get('LOAD_TEST_HMAC_SECRET', '')
+signer = (
+    hmac.new(LOAD_TEST_HMAC_SECRET.encode(), digestmod=hashlib.sha256)
+    if LOAD_TEST_HMAC_SECRET else None
+)
+
+
+def signature_valid(payload: bytes, signature: str) -> bool:
+    """Check a "sha256=<hex>" HMAC-SHA256 signature against LOAD_TEST_HMAC_SECRET"""
+    scheme, _, digest = signature.partition('=')
+    if scheme != 'sha256':
+        return False
+    try:
+        signature_bytes = bytes.fromhex(digest)
+    except ValueError:
+        return False
+    mac = signer.copy()
+    mac.update(payload)
+    return hmac.compare_digest(mac.digest(), signature_bytes)
+
+
+def end_to_end_latency_ms(data: dict, request_start: float) -> float:
+    """Latency from the payload's timestamp field to receipt"""
+    timestamp = data.get('timestamp')
+    if timestamp:
+        # timestamp is Unix epoch seconds
+        return (request_start - timestamp) * 1000
+    # Just measure processing time if no timestamp
+    return 0
+
 
 @app.route('/webhook', methods=['POST'])
-def receive_webhook():
+async def receive_webhook():
     """Receive webhook and measure latency"""
     request_start = time.time()
 
     try:
-        # Get timestamp from webhook payload
-        data = request.get_json()
+        payload = await request.get_data()
 
-        # Calculate end-to-end latency using timestamp field
-        timestamp = data.get('timestamp')
-        if timestamp:
-            # timestamp is Unix epoch seconds
-            latency_ms = (request_start - timestamp) * 1000
-        else:
-            # Just measure processing time if no timestamp
-            latency_ms = 0
+        if signer is not None and not signature_valid(
+            payload, request.headers.get('x-ethhook-signature', '')
+        ):
+            metrics.record_request(0, success=False)
+            return jsonify({
+                'status': 'error',
+                'error': 'invalid signature'
+            }), 401
+
+        # Get timestamp from webhook payload (orjson parses the raw bytes)
+        data = orjson.loads(payload)
 
+        # Calculate end-to-end latency using timestamp field
+        latency_ms = end_to_end_latency_ms(data, request_start)
         metrics.record_request(latency_ms, success=True)
 
         return jsonify({
@@ -121,15 +180,68 @@ def receive_webhook():
         }), 500
 
 
+@app.route('/webhook/batch', methods=['POST'])
+async def receive_webhook_batch():
+    """Receive many webhooks in one request and measure their latency
+
+    Body: [{"payload": "<raw webhook JSON>", "signature": "sha256=<hex>"}, ...].
+    Payloads are strings so the signed bytes survive the outer JSON. All
+    signatures are checked before anything is recorded; the first invalid
+    one rejects the whole batch.
+    """
+    request_start = time.time()
+    items = None
+
+    def reject(status, error, **details):
+        # Every webhook in a rejected batch counts as one failed request
+        failures = len(items) if isinstance(items, list) and items else 1
+        for _ in range(failures):
+            metrics.record_request(0, success=False)
+        return jsonify({'status': 'error', 'error': error, **details}), status
+
+    try:
+        items = orjson.loads(await request.get_data())
+        if not isinstance(items, list) or not all(
+            isinstance(item, dict)
+            and isinstance(item.get('payload'), str)
+            and isinstance(item.get('signature', ''), str)
+            for item in items
+        ):
+            return reject(400, 'expected [{"payload": str, "signature": str}, ...]')
+
+        payloads = [item['payload'].encode() for item in items]
+
+        if signer is not None:
+            for index, (item, payload) in enumerate(zip(items, payloads)):
+                if not signature_valid(payload, item.get('signature', '')):
+                    return reject(401, 'invalid signature', index=index)
+
+        # Measure every payload before recording, so a bad one fails the batch
+        latencies = [
+            end_to_end_latency_ms(orjson.loads(payload), request_start)
+            for payload in payloads
+        ]
+        for latency_ms in latencies:
+            metrics.record_request(latency_ms, success=True)
+
+        return jsonify({
+            'status': 'success',
+            'received': len(payloads)
+        }), 200
+
+    except Exception as e:
+        return reject(500, str(e))
+
+
 @app.route('/metrics', methods=['GET'])
-def get_metrics():
+async def get_metrics():
     """Get performance metrics"""
     stats = metrics.get_stats()
     return jsonify(stats), 200
 
 
 @app.route('/metrics/reset', methods=['POST'])
-def reset_metrics():
+async def reset_metrics():
     """Reset metrics counters"""
     global metrics
     metrics = PerformanceMetrics()
@@ -137,7 +249,7 @@ def reset_metrics():
 
 
 @app.route('/health', methods=['GET'])
-def health():
+async def health():
     """Health check endpoint"""
     stats = metrics.get_stats()
     return jsonify({
@@ -154,8 +266,10 @@ if __name__ == '__main__':
     print("="*70)
     print("  Purpose: High-performance metrics collection for load testing")
     print("  Listening: http://0.0.0.0:8000")
+    print(f"  Signatures: {'verified' if signer else 'not checked (LOAD_TEST_HMAC_SECRET unset)'}")
     print("  Endpoints:")
     print("    POST /webhook         - Receive webhooks (measures latency)")
+    print("    POST /webhook/batch   - Receive a batch of webhooks")
     print("    GET  /metrics         - Performance statistics")
     print("    POST /metrics/reset   - Reset counters")
     print("    GET  /health          - Health check")
@@ -167,5 +281,5 @@ if __name__ == '__main__':
     print("  - Latency percentiles (min/avg/p50/p95/p99/max)")
     print("="*70 + "\n")
 
-    # Run with multiple workers for high throughput
-    app.run(host='0.0.0.0', port=8000, debug=False, threaded=True)
+    # Development entrypoint; use the hypercorn command above for load tests
+    app.run(host='0.0.0.0', port=8000, debug=False)
@@ -12,29 +12,82 @@ This receiver:
 - Stores last 100 webhooks for demo dashboard
 """
 
+import asyncio
+import functools
 import hmac
 import hashlib
 import json
+import time
 from datetime import datetime
-from flask import Flask, request, jsonify
-from collections import deque
+from quart import Quart, request, jsonify
 
-app = Flask(__name__)
+app = Quart(__name__)
 
-# Store last 100 webhooks for demo display
-webhook_history = deque(maxlen=100)
+# Store last 100 webhooks for demo display. Handlers queue new entries and a
+# background task folds them into an immutable tuple, so readers just take
+# the current reference without locking or copying.
+HISTORY_SIZE = 100
+history_queue = asyncio.Queue(maxsize=HISTORY_SIZE)
+history_snapshot = ()
+
+
+async def rotate_history():
+    """Publish queued webhooks into history_snapshot"""
+    global history_snapshot
+    while True:
+        entries = [await history_queue.get()]
+        while not history_queue.empty():
+            entries.append(history_queue.get_nowait())
+        history_snapshot = (history_snapshot + tuple(entries))[-HISTORY_SIZE:]
+
+
+@app.before_serving
+async def start_history_rotator():
+    """Start the history task alongside the server"""
+    app.history_rotator = asyncio.create_task(rotate_history())
+
+
+@app.after_serving
+async def stop_history_rotator():
+    """Stop the history task on shutdown"""
+    app.history_rotator.cancel()
+
+
+# (epoch_second, text) of the banner timestamp printed most recently
+timestamp_cache = (0, '')
+
+
+def current_timestamp() -> str:
+    """Banner timestamp, reformatted only when the second changes"""
+    global timestamp_cache
+    now = int(time.time())
+    second, formatted = timestamp_cache
+    if now != second:
+        formatted = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        timestamp_cache = (now, formatted)
+    return formatted
+
+
+@functools.lru_cache(maxsize=128)
+def _secret_bytes(secret: str) -> bytes:
+    """Encode an endpoint secret once instead of on every webhook"""
+    return secret.encode()
 
 
 def verify_hmac(payload: bytes, signature: str, secret: str) -> bool:
     """Verify HMAC signature from EthHook"""
+    try:
+        signature_bytes = bytes.fromhex(signature)
+    except ValueError:
+        return False
     expected = hmac.new(
-        secret.encode(), payload, hashlib.sha256
-    ).hexdigest()
-    return hmac.compare_digest(signature, expected)
+        _secret_bytes(secret), payload, hashlib.sha256
+    ).digest()
+    return hmac.compare_digest(signature_bytes, expected)
 
 
 @app.route('/webhook', methods=['POST'])
-def receive_webhook():
+async def receive_webhook():
     """Receive webhook from EthHook"""
     
     # Get headers
@@ -43,26 +96,31 @@ def receive_webhook():
     attempt = request.headers.get('x-webhook-attempt', '1')
     
     # Get payload
-    payload = request.get_data()
+    payload = await request.get_data()
     
     try:
+        # stdlib json keeps uint256 values exact; orjson would round them
         data = json.loads(payload)
     except:
         data = {}
     
     # Store in history
+    received_at = datetime.now().isoformat()
     webhook_entry = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': received_at,
         'webhook_id': webhook_id,
         'attempt': attempt,
         'signature': signature[:16] + '...',  # Truncate for display
         'data': data
     }
-    webhook_history.append(webhook_entry)
+    if history_queue.full():
+        # More than a full history is pending; the oldest would be dropped anyway
+        history_queue.get_nowait()
+    history_queue.put_nowait(webhook_entry)
     
     # Pretty print to console
     print("\n" + "="*60)
-    print(f"🎉 WEBHOOK RECEIVED [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]")
+    print(f"🎉 WEBHOOK RECEIVED [{current_timestamp()}]")
     print("="*60)
     print(f"  ID: {webhook_id}")
     print(f"  Attempt: {attempt}")
@@ -77,27 +135,27 @@ def receive_webhook():
     # Always return 200 OK for demo
     return jsonify({
         'status': 'success',
-        'received_at': datetime.now().isoformat(),
+        'received_at': received_at,
         'webhook_id': webhook_id
     }), 200
 
 
 @app.route('/health', methods=['GET'])
-def health():
+async def health():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
         'service': 'demo-webhook-receiver',
-        'webhooks_received': len(webhook_history)
+        'webhooks_received': len(history_snapshot)
     }), 200
 
 
 @app.route('/history', methods=['GET'])
-def history():
+async def history():
     """Get recent webhook history"""
     return jsonify({
-        'total': len(webhook_history),
-        'webhooks': list(webhook_history)
+        'total': len(history_snapshot),
+        'webhooks': list(history_snapshot)
     }), 200
 
 
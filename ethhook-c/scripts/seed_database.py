@@ -5,7 +5,6 @@ This script creates users directly in the SQLite database
 """
 
 import sqlite3
-import bcrypt
 import uuid
 import sys
 from datetime import datetime
@@ -16,6 +15,10 @@ def create_demo_users(db_path):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
+    # Match the admin API's journal settings (PRAGMAs must run outside a transaction)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
     # Check if users table exists
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='users'")
     if not cursor.fetchone():
@@ -23,61 +26,71 @@ def create_demo_users(db_path):
         conn.close()
         return False
 
+    # Password hashes are precomputed (bcrypt, cost 12) because the demo
+    # credentials are fixed and hashing them on every run costs ~300ms each
     users_to_create = [
         {
             "email": "demo@ethhook.com",
             "password": "demo123",
+            "password_hash": "$2b$12$2J/bTafVDctB9sscfk/ZgeotUJymGJHL2qV1pWZnxPq6Y5LfD.CwK",
             "is_admin": 0,
         },
         {
             "email": "admin@ethhook.io",
             "password": "SecureAdmin123!",
+            "password_hash": "$2b$12$N6EwGO7IjhFiDmv/4dndYeNRJ1yTLZ6a6sUeXiM4.9U3t85MLlW96",
             "is_admin": 1,
         },
     ]
 
-    for user_data in users_to_create:
-        # Check if user already exists
-        cursor.execute("SELECT id FROM users WHERE email = ?", (user_data["email"],))
-        existing = cursor.fetchone()
+    # Hold the write lock across the existence check and the inserts
+    conn.execute("BEGIN IMMEDIATE")
 
-        if existing:
-            print(f"⚠️  User {user_data['email']} already exists, skipping...")
-            continue
+    # Check which users already exist in a single query
+    emails = [user_data["email"] for user_data in users_to_create]
+    placeholders = ", ".join("?" * len(emails))
+    cursor.execute(f"SELECT email FROM users WHERE email IN ({placeholders})", emails)
+    existing = {row[0] for row in cursor.fetchall()}
 
-        # Generate user ID
-        user_id = str(uuid.uuid4())
+    # Get current timestamp in Unix epoch (seconds)
+    created_at = int(datetime.now().timestamp())
 
-        # Hash password using bcrypt
-        password_hash = bcrypt.hashpw(
-            user_data["password"].encode("utf-8"), bcrypt.gensalt()
-        ).decode("utf-8")
-
-        # Get current timestamp in Unix epoch (seconds)
-        created_at = int(datetime.now().timestamp())
+    rows = []
+    new_users = []
+    for user_data in users_to_create:
+        if user_data["email"] in existing:
+            print(f"⚠️  User {user_data['email']} already exists, skipping...")
+            continue
 
-        # Insert user using email column
-        cursor.execute(
-            """
-            INSERT INTO users (id, email, password_hash, is_admin, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """,
+        rows.append(
             (
-                user_id,
+                str(uuid.uuid4()),
                 user_data["email"],
-                password_hash,
+                user_data["password_hash"],
                 user_data["is_admin"],
                 created_at,
-            ),
+            )
         )
+        new_users.append(user_data)
+
+    # Insert all new users using email column
+    cursor.executemany(
+        """
+        INSERT INTO users (id, email, password_hash, is_admin, created_at)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+        rows,
+    )
 
+    conn.commit()
+    conn.close()
+
+    for user_data in new_users:
         admin_status = "👑 Admin" if user_data["is_admin"] else "👤 User"
         print(
             f"✅ Created {admin_status}: {user_data['email']} (password: {user_data['password']})"
         )
 
-    conn.commit()
-    conn.close()
     return True
 
 